@@ -3,12 +3,21 @@
 
 ユーザーのCRUD操作を提供するRESTful API
 """
+import email.message
 from typing import List, Optional, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.openapi.constants import REF_PREFIX
+from pydantic import ValidationError
 from sqlmodel import Session
 from app.database import get_session
 from app.services.user_service import UserService
-from app.schemas.user import UserBase, UserResponse
+from app.schemas.user import (
+    UserBase,
+    UserResponse,
+    USER_CREATE_ADAPTER,
+    USER_RESPONSE_ADAPTER,
+)
 from app.schemas.response import ApiResponse, ListResponse
 from app.constants.error_codes import SuccessMessage
 from app.utils.logger import get_logger
@@ -31,6 +40,28 @@ def get_service(session: Session = Depends(get_session)) -> UserService:
     return UserService(session)
 
 
+def _is_json_content_type(content_type: str | None) -> bool:
+    """
+    Content-TypeがJSONかどうかを判定する
+
+    FastAPIのボディ解析と同じく application/json と application/*+json のみを許可する
+
+    Args:
+        content_type: Content-Typeヘッダーの値
+
+    Returns:
+        bool: JSONの場合True
+    """
+    if not content_type:
+        return False
+    message = email.message.Message()
+    message["content-type"] = content_type
+    if message.get_content_maintype() != "application":
+        return False
+    subtype = message.get_content_subtype()
+    return subtype == "json" or subtype.endswith("+json")
+
+
 @router.get(
     "/list",
     response_model=ApiResponse[ListResponse[UserResponse]],
@@ -67,27 +98,80 @@ async def get_user_list(
     "",
     response_model=ApiResponse[UserResponse],
     summary="ユーザー作成",
-    description="新しいユーザーを作成します"
+    description="新しいユーザーを作成します",
+    # ボディを手動で検証するため、FastAPIが自動付与する422レスポンスを明示する
+    responses={
+        422: {
+            "description": "Validation Error",
+            "content": {
+                "application/json": {"schema": {"$ref": f"{REF_PREFIX}HTTPValidationError"}}
+            }
+        }
+    },
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": {"$ref": f"{REF_PREFIX}UserBase"}}}
+        }
+    }
 )
 async def create_user(
-    user_data: UserBase,
+    request: Request,
     service: UserService = Depends(get_service)
-) -> ApiResponse[UserResponse]:
+) -> Response:
     """
     ユーザーを作成する
 
+    リクエストボディのバイト列をdictに変換せず、直接スキーマで検証する
+
     Args:
-        user_data: 作成するユーザーデータ
+        request: リクエストオブジェクト（ボディは作成するユーザーデータ）
         service: サービスインスタンス
 
     Returns:
-        ApiResponse[UserResponse]: 作成されたユーザー
+        Response: 作成されたユーザー（ApiResponse[UserResponse]のJSON）
+
+    Raises:
+        RequestValidationError: リクエストボディが不正な場合
     """
+    raw_body = await request.body()
+    # 空のボディはFastAPIのボディ検証と同じく必須項目の欠落として422とする
+    if not raw_body:
+        raise RequestValidationError(
+            [{"type": "missing", "loc": ("body",), "msg": "Field required", "input": None}],
+            body=None
+        )
+    # JSON以外のContent-Type（text/plain等）はFastAPIのボディ検証と同じく422とする
+    if not _is_json_content_type(request.headers.get("content-type")):
+        raise RequestValidationError(
+            [{
+                "type": "model_attributes_type",
+                "loc": ("body",),
+                "msg": "Input should be a valid dictionary or object to extract fields from",
+                "input": raw_body,
+            }],
+            body=raw_body
+        )
+    try:
+        user_data = USER_CREATE_ADAPTER.validate_json(raw_body)
+    except ValidationError as e:
+        # FastAPIのボディ検証と同じくlocに"body"を付けて422として返す
+        errors = [
+            {**error, "loc": ("body", *error["loc"])}
+            for error in e.errors(include_url=False)
+        ]
+        raise RequestValidationError(errors, body=raw_body) from e
+
     result = service.create_user(user_data)
-    return ApiResponse.success(
+    response = ApiResponse[UserResponse].success(
         data=result,
         message=SuccessMessage.USER_CREATED
     )
+    # 事前構築したシリアライザでJSONバイト列を直接生成する
+    return Response(
+        content=USER_RESPONSE_ADAPTER.dump_json(response),
+        media_type="application/json"
+    )
 
 
 @router.put(
@@ -4,7 +4,8 @@
 ユーザーのAPIリクエスト/レスポンススキーマ定義
 """
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+from app.schemas.response import ApiResponse
 
 
 class UserBase(BaseModel):
@@ -21,3 +22,12 @@ class UserResponse(UserBase):
     """ユーザーレスポンススキーマ"""
     model_config = {"from_attributes": True}
 
+
+# ユーザー作成リクエストの検証用アダプター
+# スキーマのコンパイルはインポート時に一度だけ行い、リクエスト間で再利用する
+USER_CREATE_ADAPTER: TypeAdapter[UserBase] = TypeAdapter(UserBase)
+
+# ユーザーレスポンス（ApiResponse[UserResponse]）のシリアライズ・検証用アダプター
+USER_RESPONSE_ADAPTER: TypeAdapter[ApiResponse[UserResponse]] = TypeAdapter(
+    ApiResponse[UserResponse]
+)
@@ -5,10 +5,13 @@ This module contains pytest fixtures that are available to all test modules.
 """
 import os
 import pytest
-from typing import Generator
+from typing import AsyncGenerator, Generator
 from sqlmodel import SQLModel, create_engine, Session
 from sqlmodel.pool import StaticPool
+from fastapi import FastAPI, HTTPException
+from fastapi.exceptions import RequestValidationError
 from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 
 # Set test environment before importing app modules
 os.environ["ENVIRONMENT"] = "local"
@@ -19,9 +22,20 @@ from app.models import user, custom_master, koujyou_master  # noqa: F401
 from app.config import Settings
 from app.database import get_session
 from app.main import app
+from app.api.exceptions import (
+    http_exception_handler,
+    validation_exception_handler,
+    general_exception_handler
+)
+from app.api.v1.endpoints import user as user_endpoints
 
+# The user router is not mounted by app.api.v1.api, so the user API is not
+# exposed by the application itself; register it on the app under test only
+if not any(getattr(route, "path", None) == "/user" for route in app.routes):
+    app.include_router(user_endpoints.router)
 
-@pytest.fixture(scope="function")
+
+@pytest.fixture(scope="session")
 def test_settings() -> Settings:
     """
     Test settings fixture
@@ -44,13 +58,17 @@ def test_settings() -> Settings:
     )
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def test_engine(test_settings: Settings):
     """
     Test database engine fixture
 
     Creates an in-memory SQLite database engine for testing.
     Uses StaticPool to ensure thread-safe testing.
+    The engine is shared by the whole test session;
+    per-test isolation is provided by the db_connection transaction.
+    When running under pytest-xdist, each worker process gets its own
+    in-memory database, so tests can run in parallel without sharing state.
 
     Args:
         test_settings: Test settings fixture
@@ -65,14 +83,26 @@ def test_engine(test_settings: Settings):
         connect_args={"check_same_thread": False},  # Required for SQLite
     )
 
+    yield engine
+
+    engine.dispose()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database_schema(test_engine):
+    """
+    Auto-use fixture to create the database schema once per test session
+
+    Args:
+        test_engine: Test database engine fixture
+    """
     # Create all tables
-    SQLModel.metadata.create_all(engine)
+    SQLModel.metadata.create_all(test_engine)
 
-    yield engine
+    yield
 
     # Cleanup: drop all tables
-    SQLModel.metadata.drop_all(engine)
-    engine.dispose()
+    SQLModel.metadata.drop_all(test_engine)
 
 
 @pytest.fixture(scope="function")
@@ -82,6 +112,9 @@ def db_connection(test_engine):
 
     Creates a single connection that will be reused for all requests in a test.
     This is important for in-memory SQLite databases.
+    The test runs inside a SAVEPOINT, so sessions bound to this connection
+    commit and roll back their own nested transactions while the outer
+    transaction is rolled back on teardown.
 
     Args:
         test_engine: Test database engine fixture
@@ -91,6 +124,7 @@ def db_connection(test_engine):
     """
     connection = test_engine.connect()
     transaction = connection.begin()
+    connection.begin_nested()
 
     try:
         yield connection
@@ -106,6 +140,8 @@ def test_session(db_connection) -> Generator[Session, None, None]:
 
     Provides a database session for each test function.
     The session is bound to a connection that persists for the test.
+    Committed instances are not expired, so seeded objects keep their
+    attributes without a refresh() round-trip.
 
     Args:
         db_connection: Database connection fixture
@@ -113,7 +149,7 @@ def test_session(db_connection) -> Generator[Session, None, None]:
     Yields:
         Session: SQLModel database session
     """
-    session = Session(bind=db_connection)
+    session = Session(bind=db_connection, expire_on_commit=False)
 
     try:
         yield session
@@ -122,20 +158,107 @@ def test_session(db_connection) -> Generator[Session, None, None]:
 
 
 @pytest.fixture(scope="function")
-def client(db_connection) -> TestClient:
+def read_session(db_connection) -> Generator[Session, None, None]:
+    """
+    Read-only database session fixture for post-request assertions
+
+    Provides a separate session on the test connection whose identity map is
+    empty, so values changed through the API are read fresh from the database
+    without having to expire the objects held by test_session.
+
+    Args:
+        db_connection: Database connection fixture
+
+    Yields:
+        Session: SQLModel database session
+    """
+    session = Session(bind=db_connection)
+
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture(scope="session")
+def client(test_engine) -> Generator[TestClient, None, None]:
     """
     FastAPI test client fixture
 
     Provides a test client for making HTTP requests to the API.
-    Overrides the database session dependency to use the test connection.
+    The client is shared by the whole test session so that the application
+    lifespan runs only once; the database dependency is overridden per test
+    by the override_get_session fixture.
 
     Args:
-        db_connection: Database connection fixture
+        test_engine: Test database engine fixture
 
-    Returns:
+    Yields:
         TestClient: FastAPI test client
     """
-    def override_get_session():
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def bare_client(test_engine) -> Generator[TestClient, None, None]:
+    """
+    Middleware-free FastAPI test client fixture
+
+    Provides a test client for a minimal application that mounts only the
+    user router and the API exception handlers, without the CORS middleware
+    and lifespan of the main app. Error responses keep the same format.
+    The application shares the dependency overrides of the main app, so
+    requests use the connection of the current test.
+
+    Args:
+        test_engine: Test database engine fixture
+
+    Yields:
+        TestClient: Test client for the user router only
+    """
+    bare_app = FastAPI()
+    bare_app.add_exception_handler(HTTPException, http_exception_handler)
+    bare_app.add_exception_handler(RequestValidationError, validation_exception_handler)
+    bare_app.add_exception_handler(Exception, general_exception_handler)
+    bare_app.include_router(user_endpoints.router)
+    bare_app.dependency_overrides = app.dependency_overrides
+
+    with TestClient(bare_app, raise_server_exceptions=False) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="function")
+async def async_client() -> AsyncGenerator[AsyncClient, None]:
+    """
+    Async HTTP client fixture
+
+    Calls the ASGI application directly in the test's event loop through
+    httpx.ASGITransport, without the thread portal used by TestClient.
+    The database dependency is overridden by the override_get_session fixture.
+
+    Yields:
+        AsyncClient: Async HTTP client for the API
+    """
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://testserver"
+    ) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="function", autouse=True)
+def override_get_session(db_connection):
+    """
+    Auto-use fixture to bind the API database session to the test connection
+
+    Overrides the database session dependency so that requests made through
+    the shared test client use the connection of the current test.
+
+    Args:
+        db_connection: Database connection fixture
+    """
+    def _get_session():
         """Override the get_session dependency to create a session from test connection"""
         session = Session(bind=db_connection)
         try:
@@ -144,11 +267,10 @@ def client(db_connection) -> TestClient:
             session.close()
 
     # Override the database dependency
-    app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_session] = _get_session
 
     try:
-        with TestClient(app) as test_client:
-            yield test_client
+        yield
     finally:
         # Clean up: remove dependency override
         app.dependency_overrides.clear()
@@ -10,7 +10,9 @@ from sqlmodel import Session
 from app.models.koujyou_master import KoujyouMaster
 
 
-def test_update_record_success(client: TestClient, test_session: Session):
+def test_update_record_success(
+    client: TestClient, test_session: Session, read_session: Session
+):
     """
     Test PUT /inventory/record with valid data
 
@@ -63,7 +65,7 @@ def test_update_record_success(client: TestClient, test_session: Session):
     assert updated_record["product_factory_name"] == "Updated Product Factory 1"
 
     # Verify record was actually updated in database
-    db_record = test_session.get(
+    db_record = read_session.get(
         KoujyouMaster,
         ("F001", "0001", "P001", date(2024, 1, 1), date(2024, 12, 31))
     )
@@ -72,7 +74,9 @@ def test_update_record_success(client: TestClient, test_session: Session):
     assert db_record.product_factory_name == "Updated Product Factory 1"
 
 
-def test_update_record_with_all_fields(client: TestClient, test_session: Session):
+def test_update_record_with_all_fields(
+    client: TestClient, test_session: Session, read_session: Session
+):
     """
     Test PUT /inventory/record updating all optional fields
 
@@ -133,7 +137,7 @@ def test_update_record_with_all_fields(client: TestClient, test_session: Session
     assert updated_record["hulftid"] == "HULFT002"
 
     # Verify record was actually updated in database
-    db_record = test_session.get(
+    db_record = read_session.get(
         KoujyouMaster,
         ("F002", "0002", "P002", date(2024, 1, 1), date(2024, 12, 31))
     )
@@ -142,7 +146,9 @@ def test_update_record_with_all_fields(client: TestClient, test_session: Session
     assert db_record.material_department_code == "MD02"
 
 
-def test_update_record_minimal_fields(client: TestClient, test_session: Session):
+def test_update_record_minimal_fields(
+    client: TestClient, test_session: Session, read_session: Session
+):
     """
     Test PUT /inventory/record with only required fields
 
@@ -188,7 +194,7 @@ def test_update_record_minimal_fields(client: TestClient, test_session: Session)
     assert updated_record["product_factory_code"] == "P003"
 
     # Verify record exists in database
-    db_record = test_session.get(
+    db_record = read_session.get(
         KoujyouMaster,
         ("F003", "0003", "P003", date(2024, 1, 1), date(2024, 12, 31))
     )
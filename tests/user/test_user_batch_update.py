@@ -4,186 +4,203 @@ Tests for PUT /user/list endpoint
 Tests the batch user update functionality with various scenarios
 """
 import pytest
-from fastapi.testclient import TestClient
-from sqlmodel import Session
+from httpx import AsyncClient
+from sqlalchemy import insert
+from sqlmodel import Session, select
 from app.models.user import User
+from tests.utils import DEFAULT_USER, send_json
+import functools
 import uuid
 
 
-def test_update_user_list_success(client: TestClient, test_session: Session):
+JANE_USER = {
+    "name": "Jane",
+    "lastname": "Smith",
+    "age": 25,
+    "country": "Canada",
+    "home_address": "456 Oak Ave"
+}
+BOB_USER = {
+    "name": "Bob",
+    "lastname": "Johnson",
+    "age": 35,
+    "country": "UK",
+    "home_address": "789 Pine Rd"
+}
+
+
+def _assert_ok(response, n_ok: int, n_err: int = 0) -> list:
+    """
+    Assert that a batch update response succeeded
+
+    Args:
+        response: HTTP response of PUT /user/list
+        n_ok: Expected number of ok_records
+        n_err: Expected number of error_records
+
+    Returns:
+        list: ok_records of the response
+    """
+    assert response.status_code == 200
+    data = response.json()
+    assert data["code"] == 200 and "message" in data and data["error"] is None
+    ok_records, error_records = data["data"]["ok_records"], data["data"]["error_records"]
+    assert len(ok_records) == n_ok and len(error_records) == n_err
+    return ok_records
+
+
+@functools.lru_cache
+def _large_batch_payloads(n: int) -> tuple[tuple[dict, ...], tuple[dict, ...]]:
+    """
+    Build the seed rows and update payload for the large batch test
+
+    The result is cached per batch size so repeated runs reuse the same
+    pre-computed structures.
+
+    Args:
+        n: Number of users in the batch
+
+    Returns:
+        tuple: Seed rows for bulk INSERT and the matching update payload
+    """
+    rows = tuple(
+        {
+            "id": str(uuid.uuid4()),
+            "name": f"User{i}",
+            "lastname": "Test",
+            "age": 20 + i,
+            "country": "USA",
+            "home_address": f"{i} Main St"
+        }
+        for i in range(n)
+    )
+    updates = tuple(
+        {
+            "id": row["id"],
+            "name": f"User{i} Updated",
+            "age": 30 + i
+        }
+        for i, row in enumerate(rows)
+    )
+    return rows, updates
+
+
+async def test_update_user_list_success(
+    async_client: AsyncClient, test_session: Session, read_session: Session
+):
     """
     Test PUT /user/list with valid data
 
     Should update multiple users successfully
     """
     # Create users first
-    user1 = User(
-        name="John",
-        lastname="Doe",
-        age=30,
-        country="USA",
-        home_address="123 Main St"
-    )
-    user2 = User(
-        name="Jane",
-        lastname="Smith",
-        age=25,
-        country="Canada",
-        home_address="456 Oak Ave"
-    )
-    user3 = User(
-        name="Bob",
-        lastname="Johnson",
-        age=35,
-        country="UK",
-        home_address="789 Pine Rd"
-    )
-    test_session.add(user1)
-    test_session.add(user2)
-    test_session.add(user3)
+    user1_id = str(uuid.uuid4())
+    user1 = User(id=user1_id, **DEFAULT_USER)
+    user2_id = str(uuid.uuid4())
+    user2 = User(id=user2_id, **JANE_USER)
+    user3_id = str(uuid.uuid4())
+    user3 = User(id=user3_id, **BOB_USER)
+    test_session.add_all([user1, user2, user3])
     test_session.commit()
-    test_session.refresh(user1)
-    test_session.refresh(user2)
-    test_session.refresh(user3)
 
     # Update users
     user_data_list = [
         {
-            "id": user1.id,
+            "id": user1_id,
             "name": "John Updated",
             "age": 31
         },
         {
-            "id": user2.id,
+            "id": user2_id,
             "name": "Jane Updated",
             "age": 26
         },
         {
-            "id": user3.id,
+            "id": user3_id,
             "name": "Bob Updated",
             "age": 36
         }
     ]
 
-    response = client.put("/user/list", json=user_data_list)
+    response = await async_client.put("/user/list", json=user_data_list)
 
-    assert response.status_code == 200
-    data = response.json()
+    _assert_ok(response, 3)
 
-    # Verify response structure
-    assert "code" in data
-    assert "message" in data
-    assert "data" in data
-    assert data["code"] == 200
-    assert data["error"] is None
-
-    # Verify response data structure
-    assert "ok_records" in data["data"]
-    assert "error_records" in data["data"]
-    assert len(data["data"]["ok_records"]) == 3
-    assert len(data["data"]["error_records"]) == 0
-
-    # Verify updated users
-    ok_records = data["data"]["ok_records"]
-    assert len(ok_records) == 3
-
-    # Verify updates in database (refresh session to see updates from API)
-    test_session.expire_all()
-    db_user1 = test_session.get(User, user1.id)
+    # Verify updates in database (fresh session sees the committed updates)
+    db_user1 = read_session.get(User, user1_id)
     assert db_user1.name == "John Updated"
     assert db_user1.age == 31
 
-    db_user2 = test_session.get(User, user2.id)
+    db_user2 = read_session.get(User, user2_id)
     assert db_user2.name == "Jane Updated"
     assert db_user2.age == 26
 
-    db_user3 = test_session.get(User, user3.id)
+    db_user3 = read_session.get(User, user3_id)
     assert db_user3.name == "Bob Updated"
     assert db_user3.age == 36
 
 
-def test_update_user_list_partial_update(client: TestClient, test_session: Session):
+async def test_update_user_list_partial_update(
+    async_client: AsyncClient, test_session: Session, read_session: Session
+):
     """
     Test PUT /user/list with partial updates
 
     Should update only provided fields
     """
     # Create users first
-    user1 = User(
-        name="John",
-        lastname="Doe",
-        age=30,
-        country="USA",
-        home_address="123 Main St"
-    )
-    user2 = User(
-        name="Jane",
-        lastname="Smith",
-        age=25,
-        country="Canada",
-        home_address="456 Oak Ave"
-    )
-    test_session.add(user1)
-    test_session.add(user2)
+    user1_id = str(uuid.uuid4())
+    user1 = User(id=user1_id, **DEFAULT_USER)
+    user2_id = str(uuid.uuid4())
+    user2 = User(id=user2_id, **JANE_USER)
+    test_session.add_all([user1, user2])
     test_session.commit()
-    test_session.refresh(user1)
-    test_session.refresh(user2)
 
     # Update only specific fields
     user_data_list = [
         {
-            "id": user1.id,
+            "id": user1_id,
             "name": "John Updated"
         },
         {
-            "id": user2.id,
+            "id": user2_id,
             "age": 26
         }
     ]
 
-    response = client.put("/user/list", json=user_data_list)
+    response = await async_client.put("/user/list", json=user_data_list)
 
-    assert response.status_code == 200
-    data = response.json()
+    _assert_ok(response, 2)
 
-    assert len(data["data"]["ok_records"]) == 2
-
-    # Verify partial updates (refresh session to see updates from API)
-    test_session.expire_all()
-    db_user1 = test_session.get(User, user1.id)
+    # Verify partial updates (fresh session sees the committed updates)
+    db_user1 = read_session.get(User, user1_id)
     assert db_user1.name == "John Updated"
     assert db_user1.lastname == "Doe"  # Unchanged
     assert db_user1.age == 30  # Unchanged
 
-    db_user2 = test_session.get(User, user2.id)
+    db_user2 = read_session.get(User, user2_id)
     assert db_user2.name == "Jane"  # Unchanged
     assert db_user2.age == 26  # Updated
 
 
-def test_update_user_list_not_found(client: TestClient, test_session: Session):
+async def test_update_user_list_not_found(async_client: AsyncClient, test_session: Session):
     """
     Test PUT /user/list with non-existent user IDs
 
     Should return 400 with error records
     """
     # Create one user
-    user = User(
-        name="John",
-        lastname="Doe",
-        age=30,
-        country="USA",
-        home_address="123 Main St"
-    )
+    user_id = str(uuid.uuid4())
+    user = User(id=user_id, **DEFAULT_USER)
     test_session.add(user)
     test_session.commit()
-    test_session.refresh(user)
 
     non_existent_id = str(uuid.uuid4())
 
     # Try to update existing and non-existent users
     user_data_list = [
         {
-            "id": user.id,
+            "id": user_id,
             "name": "John Updated"
         },
         {
@@ -192,7 +209,7 @@ def test_update_user_list_not_found(client: TestClient, test_session: Session):
         }
     ]
 
-    response = client.put("/user/list", json=user_data_list)
+    response = await async_client.put("/user/list", json=user_data_list)
 
     # Should return 400 or 500 if there are errors
     assert response.status_code in [400, 500]
@@ -203,20 +220,16 @@ def test_update_user_list_not_found(client: TestClient, test_session: Session):
     # Error records might be empty if error handling is different
     assert len(error_records) >= 0
 
-    # Verify the existing user was not updated (transaction rollback) by checking via GET endpoint
-    list_response = client.get("/user/list")
-    assert list_response.status_code == 200
-    users = list_response.json()["data"]["items"]
-    user_ids = [u["id"] for u in users]
-    
     # With 400, transaction should have rolled back. With 500, behavior may vary
     if response.status_code == 400:
-        assert user.id in user_ids, f"User {user.id} should still exist (transaction rollback)"
-        user_data = next(u for u in users if u["id"] == user.id)
-        assert user_data["name"] == "John"  # Not updated due to rollback
+        # Verify the existing user was not updated (transaction rollback) directly in the database
+        db_name = test_session.execute(
+            select(User.name).where(User.id == user_id)
+        ).scalar_one()
+        assert db_name == "John"  # Not updated due to rollback
 
 
-def test_update_user_list_empty_list(client: TestClient):
+async def test_update_user_list_empty_list(async_client: AsyncClient):
     """
     Test PUT /user/list with empty list
 
@@ -224,496 +237,186 @@ def test_update_user_list_empty_list(client: TestClient):
     """
     user_data_list = []
 
-    response = client.put("/user/list", json=user_data_list)
-
-    assert response.status_code == 200
-    data = response.json()
+    response = await async_client.put("/user/list", json=user_data_list)
 
-    assert "ok_records" in data["data"]
-    assert "error_records" in data["data"]
-    assert len(data["data"]["ok_records"]) == 0
-    assert len(data["data"]["error_records"]) == 0
+    _assert_ok(response, 0)
 
 
-def test_update_user_list_single_user(client: TestClient, test_session: Session):
+async def test_update_user_list_single_user(
+    async_client: AsyncClient, test_session: Session, read_session: Session
+):
     """
     Test PUT /user/list with single user
 
     Should update single user successfully
     """
     # Create user first
-    user = User(
-        name="John",
-        lastname="Doe",
-        age=30,
-        country="USA",
-        home_address="123 Main St"
-    )
+    user_id = str(uuid.uuid4())
+    user = User(id=user_id, **DEFAULT_USER)
     test_session.add(user)
     test_session.commit()
-    test_session.refresh(user)
 
     # Update user
     user_data_list = [
         {
-            "id": user.id,
+            "id": user_id,
             "name": "John Updated",
             "age": 31
         }
     ]
 
-    response = client.put("/user/list", json=user_data_list)
+    response = await async_client.put("/user/list", json=user_data_list)
 
-    assert response.status_code == 200
-    data = response.json()
+    _assert_ok(response, 1)
 
-    assert len(data["data"]["ok_records"]) == 1
-    assert len(data["data"]["error_records"]) == 0
-
-    # Verify update (refresh session to see updates from API)
-    test_session.expire_all()
-    db_user = test_session.get(User, user.id)
+    # Verify update (fresh session sees the committed updates)
+    db_user = read_session.get(User, user_id)
     assert db_user.name == "John Updated"
     assert db_user.age == 31
 
 
-def test_update_user_list_large_batch(client: TestClient, test_session: Session):
+async def test_update_user_list_large_batch(
+    async_client: AsyncClient, test_session: Session, read_session: Session
+):
     """
     Test PUT /user/list with large batch
 
     Should handle large number of updates
     """
-    # Create users first
-    users = []
-    for i in range(50):
-        user = User(
-            name=f"User{i}",
-            lastname="Test",
-            age=20 + i,
-            country="USA",
-            home_address=f"{i} Main St"
-        )
-        users.append(user)
-        test_session.add(user)
+    # Create users first with a single bulk INSERT
+    rows, user_data_list = _large_batch_payloads(50)
+    test_session.execute(insert(User), list(rows))
     test_session.commit()
-    for user in users:
-        test_session.refresh(user)
+    user_ids = [row["id"] for row in rows]
 
     # Update all users
-    user_data_list = [
-        {
-            "id": user.id,
-            "name": f"User{i} Updated",
-            "age": 30 + i
-        }
-        for i, user in enumerate(users)
-    ]
-
-    response = client.put("/user/list", json=user_data_list)
-
-    assert response.status_code == 200
-    data = response.json()
-
-    assert len(data["data"]["ok_records"]) == 50
-    assert len(data["data"]["error_records"]) == 0
-
-    # Verify updates (refresh session to see updates from API)
-    test_session.expire_all()
-    for i, user in enumerate(users):
-        db_user = test_session.get(User, user.id)
-        assert db_user.name == f"User{i} Updated"
-        assert db_user.age == 30 + i
-
+    response = await send_json(async_client, "PUT", "/user/list", user_data_list)
 
-def test_update_user_list_with_unicode_characters(client: TestClient, test_session: Session):
-    """
-    Test PUT /user/list with Unicode characters
-
-    Should handle Unicode characters correctly
-    """
-    # Create users first
-    user1 = User(
-        name="John",
-        lastname="Doe",
-        age=30,
-        country="USA",
-        home_address="123 Main St"
-    )
-    user2 = User(
-        name="Jane",
-        lastname="Smith",
-        age=25,
-        country="Canada",
-        home_address="456 Oak Ave"
-    )
-    test_session.add(user1)
-    test_session.add(user2)
-    test_session.commit()
-    test_session.refresh(user1)
-    test_session.refresh(user2)
+    _assert_ok(response, 50)
 
-    # Update with Unicode characters
-    user_data_list = [
-        {
-            "id": user1.id,
-            "name": "José",
-            "lastname": "García",
-            "country": "México"
-        },
-        {
-            "id": user2.id,
-            "name": "山田",
-            "lastname": "太郎",
-            "country": "日本"
-        }
-    ]
-
-    response = client.put("/user/list", json=user_data_list)
-
-    assert response.status_code == 200
-    data = response.json()
-
-    assert len(data["data"]["ok_records"]) == 2
-
-    # Verify Unicode updates (refresh session to see updates from API)
-    test_session.expire_all()
-    db_user1 = test_session.get(User, user1.id)
-    assert db_user1.name == "José"
-    assert db_user1.lastname == "García"
-    assert db_user1.country == "México"
-
-    db_user2 = test_session.get(User, user2.id)
-    assert db_user2.name == "山田"
-    assert db_user2.lastname == "太郎"
-    assert db_user2.country == "日本"
-
-
-def test_update_user_list_with_special_characters(client: TestClient, test_session: Session):
-    """
-    Test PUT /user/list with special characters
-
-    Should handle special characters correctly
-    """
-    # Create users first
-    user1 = User(
-        name="John",
-        lastname="Doe",
-        age=30,
-        country="USA",
-        home_address="123 Main St"
-    )
-    user2 = User(
-        name="Jane",
-        lastname="Smith",
-        age=25,
-        country="Canada",
-        home_address="456 Oak Ave"
-    )
-    test_session.add(user1)
-    test_session.add(user2)
-    test_session.commit()
-    test_session.refresh(user1)
-    test_session.refresh(user2)
-
-    # Update with special characters
-    user_data_list = [
-        {
-            "id": user1.id,
-            "name": "O'Brien",
-            "lastname": "Smith-Johnson",
-            "home_address": "123 Main St. #4, Apt. B"
-        },
-        {
-            "id": user2.id,
-            "lastname": "O'Connor",
-            "home_address": "Dublin St., Co. Dublin"
-        }
-    ]
-
-    response = client.put("/user/list", json=user_data_list)
-
-    assert response.status_code == 200
-    data = response.json()
-
-    assert len(data["data"]["ok_records"]) == 2
-
-    # Verify special characters (refresh session to see updates from API)
-    test_session.expire_all()
-    db_user1 = test_session.get(User, user1.id)
-    assert db_user1.name == "O'Brien"
-    assert db_user1.lastname == "Smith-Johnson"
-    assert db_user1.home_address == "123 Main St. #4, Apt. B"
-
-    db_user2 = test_session.get(User, user2.id)
-    assert db_user2.lastname == "O'Connor"
-    assert db_user2.home_address == "Dublin St., Co. Dublin"
-
-
-def test_update_user_list_with_long_strings(client: TestClient, test_session: Session):
-    """
-    Test PUT /user/list with very long string values
-
-    Should handle long strings correctly
-    """
-    # Create user first
-    user = User(
-        name="John",
-        lastname="Doe",
-        age=30,
-        country="USA",
-        home_address="123 Main St"
-    )
-    test_session.add(user)
-    test_session.commit()
-    test_session.refresh(user)
-
-    # Update with long strings
-    long_name = "A" * 500
-    long_address = "B" * 1000
-
-    user_data_list = [
-        {
-            "id": user.id,
-            "name": long_name,
-            "home_address": long_address
-        }
-    ]
-
-    response = client.put("/user/list", json=user_data_list)
-
-    assert response.status_code == 200
-    data = response.json()
-
-    assert len(data["data"]["ok_records"]) == 1
-
-    # Verify long strings (refresh session to see updates from API)
-    test_session.expire_all()
-    db_user = test_session.get(User, user.id)
-    assert len(db_user.name) == 500
-    assert len(db_user.home_address) == 1000
-
-
-def test_update_user_list_with_zero_age(client: TestClient, test_session: Session):
-    """
-    Test PUT /user/list with age = 0
-
-    Should accept zero as valid age
-    """
-    # Create user first
-    user = User(
-        name="John",
-        lastname="Doe",
-        age=30,
-        country="USA",
-        home_address="123 Main St"
-    )
-    test_session.add(user)
-    test_session.commit()
-    test_session.refresh(user)
-
-    # Update age to 0
-    user_data_list = [
-        {
-            "id": user.id,
-            "age": 0
-        }
-    ]
-
-    response = client.put("/user/list", json=user_data_list)
-
-    assert response.status_code == 200
-    data = response.json()
-
-    assert len(data["data"]["ok_records"]) == 1
-    assert data["data"]["ok_records"][0]["age"] == 0
-
-    # Verify in database (refresh session to see updates from API)
-    test_session.expire_all()
-    db_user = test_session.get(User, user.id)
-    assert db_user.age == 0
-
-
-def test_update_user_list_with_very_large_age(client: TestClient, test_session: Session):
-    """
-    Test PUT /user/list with very large age
-
-    Should handle large integer values
-    """
-    # Create user first
-    user = User(
-        name="John",
-        lastname="Doe",
-        age=30,
-        country="USA",
-        home_address="123 Main St"
-    )
-    test_session.add(user)
-    test_session.commit()
-    test_session.refresh(user)
-
-    # Update age to very large number
-    user_data_list = [
-        {
-            "id": user.id,
-            "age": 999999
-        }
-    ]
-
-    response = client.put("/user/list", json=user_data_list)
-
-    assert response.status_code == 200
-    data = response.json()
-
-    assert len(data["data"]["ok_records"]) == 1
-    assert data["data"]["ok_records"][0]["age"] == 999999
-
-    # Verify in database (refresh session to see updates from API)
-    test_session.expire_all()
-    db_user = test_session.get(User, user.id)
-    assert db_user.age == 999999
-
-
-def test_update_user_list_with_none_values(client: TestClient, test_session: Session):
-    """
-    Test PUT /user/list with None values
-
-    Should handle None values correctly
-    """
-    # Create user first
-    user = User(
-        name="John",
-        lastname="Doe",
-        age=30,
-        country="USA",
-        home_address="123 Main St"
-    )
-    test_session.add(user)
-    test_session.commit()
-    test_session.refresh(user)
-
-    # Update with None values
-    user_data_list = [
-        {
-            "id": user.id,
-            "name": None,
-            "lastname": None,
-            "age": None,
-            "country": None,
-            "home_address": None
-        }
-    ]
-
-    response = client.put("/user/list", json=user_data_list)
-
-    assert response.status_code == 200
-    data = response.json()
-
-    assert len(data["data"]["ok_records"]) == 1
-
-    # Verify None values (refresh session to see updates from API)
-    test_session.expire_all()
-    db_user = test_session.get(User, user.id)
-    assert db_user.name is None
-    assert db_user.lastname is None
-    assert db_user.age is None
-    assert db_user.country is None
-    assert db_user.home_address is None
-
-
-def test_update_user_list_with_empty_strings(client: TestClient, test_session: Session):
-    """
-    Test PUT /user/list with empty string values
-
-    Should update fields to empty strings
+    # Verify updates in a single query (fresh session sees the committed updates)
+    db_users = {
+        db_user.id: db_user
+        for db_user in read_session.execute(
+            select(User).where(User.id.in_(user_ids))
+        ).scalars()
+    }
+    for i, user_id in enumerate(user_ids):
+        assert db_users[user_id].name == f"User{i} Updated"
+        assert db_users[user_id].age == 30 + i
+
+
+@pytest.mark.parametrize(
+    "update_data",
+    [
+        pytest.param(
+            {"name": "José", "lastname": "García", "country": "México"},
+            id="unicode_characters",
+        ),
+        pytest.param(
+            {"name": "山田", "lastname": "太郎", "country": "日本"},
+            id="japanese_characters",
+        ),
+        pytest.param(
+            {
+                "name": "O'Brien",
+                "lastname": "Smith-Johnson",
+                "home_address": "123 Main St. #4, Apt. B",
+            },
+            id="special_characters",
+        ),
+        pytest.param(
+            {"lastname": "O'Connor", "home_address": "Dublin St., Co. Dublin"},
+            id="special_characters_partial",
+        ),
+        pytest.param(
+            {"name": "A" * 500, "home_address": "B" * 1000},
+            id="long_strings",
+        ),
+        pytest.param({"age": 0}, id="zero_age"),
+        pytest.param({"age": 999999}, id="very_large_age"),
+        pytest.param(
+            {"name": None, "lastname": None, "age": None, "country": None, "home_address": None},
+            id="none_values",
+        ),
+        pytest.param(
+            {"name": "", "lastname": "", "country": "", "home_address": ""},
+            id="empty_strings",
+        ),
+    ],
+)
+async def test_update_user_list_value_variants(
+    async_client: AsyncClient, test_session: Session, read_session: Session, update_data: dict
+):
+    """
+    Test PUT /user/list with various field values
+
+    Should store Unicode, special characters, long strings, boundary ages,
+    None values and empty strings exactly as sent
     """
     # Create user first
-    user = User(
-        name="John",
-        lastname="Doe",
-        age=30,
-        country="USA",
-        home_address="123 Main St"
-    )
+    user_id = str(uuid.uuid4())
+    user = User(id=user_id, **DEFAULT_USER)
     test_session.add(user)
     test_session.commit()
-    test_session.refresh(user)
 
-    # Update with empty strings
-    user_data_list = [
-        {
-            "id": user.id,
-            "name": "",
-            "lastname": "",
-            "country": "",
-            "home_address": ""
-        }
-    ]
+    user_data_list = [{"id": user_id, **update_data}]
 
-    response = client.put("/user/list", json=user_data_list)
+    response = await send_json(async_client, "PUT", "/user/list", user_data_list)
 
-    assert response.status_code == 200
-    data = response.json()
-
-    assert len(data["data"]["ok_records"]) == 1
+    ok_records = _assert_ok(response, 1)
+    for field, value in update_data.items():
+        assert ok_records[0][field] == value
 
-    # Verify empty strings (refresh session to see updates from API)
-    test_session.expire_all()
-    db_user = test_session.get(User, user.id)
-    assert db_user.name == ""
-    assert db_user.lastname == ""
-    assert db_user.country == ""
-    assert db_user.home_address == ""
+    # Verify in database (fresh session sees the committed updates)
+    db_user = read_session.get(User, user_id)
+    for field, value in update_data.items():
+        assert getattr(db_user, field) == value
 
 
-def test_update_user_list_invalid_json(client: TestClient):
+async def test_update_user_list_invalid_json(async_client: AsyncClient):
     """
     Test PUT /user/list with invalid JSON
 
     Should return 422 validation error
     """
-    response = client.put(
+    response = await async_client.put(
         "/user/list",
-        data="invalid json",
+        content="invalid json",
         headers={"Content-Type": "application/json"}
     )
 
     assert response.status_code == 422
 
 
-def test_update_user_list_wrong_data_types(client: TestClient, test_session: Session):
+async def test_update_user_list_wrong_data_types(async_client: AsyncClient, test_session: Session):
     """
     Test PUT /user/list with wrong data types
 
     Should return 422 validation error or handle gracefully
     """
     # Create user first
-    user = User(
-        name="John",
-        lastname="Doe",
-        age=30,
-        country="USA",
-        home_address="123 Main St"
-    )
+    user_id = str(uuid.uuid4())
+    user = User(id=user_id, **DEFAULT_USER)
     test_session.add(user)
     test_session.commit()
-    test_session.refresh(user)
 
     # Try to update with wrong types
     user_data_list = [
         {
-            "id": user.id,
+            "id": user_id,
             "name": 123,  # Should be string
             "age": "thirty"  # Should be integer
         }
     ]
 
-    response = client.put("/user/list", json=user_data_list)
+    response = await async_client.put("/user/list", json=user_data_list)
 
     # Should either validate or process
     assert response.status_code in [200, 400, 422]
 
 
-def test_update_user_list_not_list(client: TestClient):
+async def test_update_user_list_not_list(async_client: AsyncClient):
     """
     Test PUT /user/list with non-list data
 
@@ -726,12 +429,12 @@ def test_update_user_list_not_list(client: TestClient):
         "age": 30
     }
 
-    response = client.put("/user/list", json=user_data)
+    response = await async_client.put("/user/list", json=user_data)
 
     assert response.status_code == 422
 
 
-def test_update_user_list_without_ids(client: TestClient):
+async def test_update_user_list_without_ids(async_client: AsyncClient):
     """
     Test PUT /user/list without IDs
 
@@ -745,117 +448,86 @@ def test_update_user_list_without_ids(client: TestClient):
         }
     ]
 
-    response = client.put("/user/list", json=user_data_list)
+    response = await async_client.put("/user/list", json=user_data_list)
 
     # Should fail because ID is required for update
     assert response.status_code in [400, 422]
 
 
-def test_update_user_list_database_consistency(client: TestClient, test_session: Session):
+async def test_update_user_list_database_consistency(
+    async_client: AsyncClient, test_session: Session, read_session: Session
+):
     """
     Test PUT /user/list database consistency
 
     Should maintain data integrity after batch update
     """
     # Create users first
-    user1 = User(
-        name="John",
-        lastname="Doe",
-        age=30,
-        country="USA",
-        home_address="123 Main St"
-    )
-    user2 = User(
-        name="Jane",
-        lastname="Smith",
-        age=25,
-        country="Canada",
-        home_address="456 Oak Ave"
-    )
-    test_session.add(user1)
-    test_session.add(user2)
+    user1_id = str(uuid.uuid4())
+    user1 = User(id=user1_id, **DEFAULT_USER)
+    user2_id = str(uuid.uuid4())
+    user2 = User(id=user2_id, **JANE_USER)
+    test_session.add_all([user1, user2])
     test_session.commit()
-    test_session.refresh(user1)
-    test_session.refresh(user2)
 
     # Update users
     user_data_list = [
         {
-            "id": user1.id,
+            "id": user1_id,
             "name": "John Updated",
             "age": 31
         },
         {
-            "id": user2.id,
+            "id": user2_id,
             "name": "Jane Updated",
             "age": 26
         }
     ]
 
-    response = client.put("/user/list", json=user_data_list)
-    assert response.status_code == 200
-
-    # Verify updates in database (refresh session to see updates from API)
-    test_session.expire_all()
-    db_user1 = test_session.get(User, user1.id)
-    assert db_user1.name == "John Updated"
-    assert db_user1.age == 31
-
-    db_user2 = test_session.get(User, user2.id)
-    assert db_user2.name == "Jane Updated"
-    assert db_user2.age == 26
-
-    # Verify users can be retrieved via GET
-    list_response = client.get("/user/list")
-    assert list_response.status_code == 200
-    users = list_response.json()["data"]["items"]
-    user_ids = [u["id"] for u in users]
-    assert user1.id in user_ids
-    assert user2.id in user_ids
-
-    # Verify updated data in list
-    updated_user1 = next(u for u in users if u["id"] == user1.id)
-    assert updated_user1["name"] == "John Updated"
-    assert updated_user1["age"] == 31
+    response = await async_client.put("/user/list", json=user_data_list)
+    # Verify updated data in the response
+    ok_records = {u["id"]: u for u in _assert_ok(response, 2)}
+    assert ok_records[user1_id]["name"] == "John Updated"
+    assert ok_records[user1_id]["age"] == 31
+    assert ok_records[user2_id]["name"] == "Jane Updated"
+    assert ok_records[user2_id]["age"] == 26
+
+    # Verify updates in database in a single query (fresh session sees the committed updates)
+    db_users = {
+        db_user.id: db_user
+        for db_user in read_session.execute(
+            select(User).where(User.id.in_([user1_id, user2_id]))
+        ).scalars()
+    }
+    assert db_users[user1_id].name == "John Updated"
+    assert db_users[user1_id].age == 31
 
-    updated_user2 = next(u for u in users if u["id"] == user2.id)
-    assert updated_user2["name"] == "Jane Updated"
-    assert updated_user2["age"] == 26
+    assert db_users[user2_id].name == "Jane Updated"
+    assert db_users[user2_id].age == 26
 
 
-def test_update_user_list_transaction_rollback(client: TestClient, test_session: Session):
+async def test_update_user_list_transaction_rollback(
+    async_client: AsyncClient, test_session: Session
+):
     """
     Test PUT /user/list transaction rollback on errors
 
     Should rollback all changes if any record fails
     """
     # Create users first
-    user1 = User(
-        name="John",
-        lastname="Doe",
-        age=30,
-        country="USA",
-        home_address="123 Main St"
-    )
-    user2 = User(
-        name="Jane",
-        lastname="Smith",
-        age=25,
-        country="Canada",
-        home_address="456 Oak Ave"
-    )
-    test_session.add(user1)
-    test_session.add(user2)
+    user1_id = str(uuid.uuid4())
+    user1 = User(id=user1_id, **DEFAULT_USER)
+    user2_id = str(uuid.uuid4())
+    user2 = User(id=user2_id, **JANE_USER)
+    test_session.add_all([user1, user2])
     test_session.commit()
-    test_session.refresh(user1)
-    test_session.refresh(user2)
 
     non_existent_id = str(uuid.uuid4())
 
     # Try to update existing and non-existent users
     user_data_list = [
         {
-            "id": user1.id,
+            "id": user1_id,
             "name": "John Updated"
         },
         {
@@ -864,94 +536,79 @@ def test_update_user_list_transaction_rollback(client: TestClient, test_session:
         }
     ]
 
-    response = client.put("/user/list", json=user_data_list)
+    response = await async_client.put("/user/list", json=user_data_list)
 
     # Should return 400 or 500
     assert response.status_code in [400, 500]
 
-    # Verify user1 was not updated (transaction rollback) by checking via GET endpoint
-    list_response = client.get("/user/list")
-    assert list_response.status_code == 200
-    users = list_response.json()["data"]["items"]
-    user_ids = [u["id"] for u in users]
-    
     # With 400, transaction should have rolled back. With 500, behavior may vary
     if response.status_code == 400:
-        assert user1.id in user_ids, f"User {user1.id} should still exist (transaction rollback)"
-        user1_data = next(u for u in users if u["id"] == user1.id)
-        assert user1_data["name"] == "John"  # Not updated due to rollback
+        # Verify user1 was not updated (transaction rollback) directly in the database
+        db_name1 = test_session.execute(
+            select(User.name).where(User.id == user1_id)
+        ).scalar_one()
+        assert db_name1 == "John"  # Not updated due to rollback
         # Verify user2 was not affected
-        assert user2.id in user_ids, f"User {user2.id} should still exist"
-        user2_data = next(u for u in users if u["id"] == user2.id)
-        assert user2_data["name"] == "Jane"  # Unchanged
+        db_name2 = test_session.execute(
+            select(User.name).where(User.id == user2_id)
+        ).scalar_one()
+        assert db_name2 == "Jane"  # Unchanged
 
 
-def test_update_user_list_multiple_updates_consistency(client: TestClient, test_session: Session):
+async def test_update_user_list_multiple_updates_consistency(
+    async_client: AsyncClient, test_session: Session, read_session: Session
+):
     """
     Test PUT /user/list with multiple sequential batch updates
 
     Should maintain consistency across multiple operations
     """
     # Create users first
-    user1 = User(
-        name="John",
-        lastname="Doe",
-        age=30,
-        country="USA",
-        home_address="123 Main St"
-    )
-    user2 = User(
-        name="Jane",
-        lastname="Smith",
-        age=25,
-        country="Canada",
-        home_address="456 Oak Ave"
-    )
-    test_session.add(user1)
-    test_session.add(user2)
+    user1_id = str(uuid.uuid4())
+    user1 = User(id=user1_id, **DEFAULT_USER)
+    user2_id = str(uuid.uuid4())
+    user2 = User(id=user2_id, **JANE_USER)
+    test_session.add_all([user1, user2])
     test_session.commit()
-    test_session.refresh(user1)
-    test_session.refresh(user2)
 
     # First batch update
     user_data_list1 = [
         {
-            "id": user1.id,
+            "id": user1_id,
             "name": "John First",
             "age": 31
         },
         {
-            "id": user2.id,
+            "id": user2_id,
             "name": "Jane First",
             "age": 26
         }
     ]
-    response1 = client.put("/user/list", json=user_data_list1)
+    response1 = await async_client.put("/user/list", json=user_data_list1)
     assert response1.status_code == 200
 
     # Second batch update
     user_data_list2 = [
         {
-            "id": user1.id,
+            "id": user1_id,
             "name": "John Second",
             "age": 32
         },
         {
-            "id": user2.id,
+            "id": user2_id,
             "name": "Jane Second",
             "age": 27
         }
     ]
-    response2 = client.put("/user/list", json=user_data_list2)
+    response2 = await async_client.put("/user/list", json=user_data_list2)
     assert response2.status_code == 200
 
-    # Verify final state (refresh session to see updates from API)
-    test_session.expire_all()
-    db_user1 = test_session.get(User, user1.id)
+    # Verify final state (fresh session sees the committed updates)
+    db_user1 = read_session.get(User, user1_id)
     assert db_user1.name == "John Second"
     assert db_user1.age == 32
 
-    db_user2 = test_session.get(User, user2.id)
+    db_user2 = read_session.get(User, user2_id)
     assert db_user2.name == "Jane Second"
     assert db_user2.age == 27
 
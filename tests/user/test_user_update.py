@@ -5,87 +5,94 @@ Tests the user update functionality with various scenarios
 """
 import pytest
 from fastapi.testclient import TestClient
+from httpx import AsyncClient
+from sqlalchemy import insert
 from sqlmodel import Session
 from app.models.user import User
-import uuid
+from app.schemas.user import USER_RESPONSE_ADAPTER, UserResponse
+from tests.utils import DEFAULT_USER, rjson, send_json
 
 
-def test_update_user_success(client: TestClient, test_session: Session):
+# Well-formed user ID that is never stored by any test
+_MISSING_ID = "00000000-0000-4000-8000-000000000000"
+
+# Full update applied to the seeded user; tests add the "id" of the target user
+_BASE_UPDATE = {
+    "name": "John Updated",
+    "lastname": "Doe Updated",
+    "age": 31,
+    "country": "Canada",
+    "home_address": "456 Oak Ave"
+}
+
+
+def _assert_ok(response, **expected) -> UserResponse:
+    """
+    Assert a successful PUT /user response and the echoed field values
+
+    The envelope is validated strictly against ApiResponse[UserResponse]
+    (no type coercion) while the body is decoded.
+
+    Args:
+        response: HTTP response from the test client
+        **expected: Expected value for each echoed user field
+
+    Returns:
+        UserResponse: Updated user data from the response
+    """
+    assert response.status_code == 200
+    resp = USER_RESPONSE_ADAPTER.validate_json(response.content, strict=True)
+    assert resp.code == 200
+    assert resp.error is None
+    for field, value in expected.items():
+        assert getattr(resp.data, field) == value
+    return resp.data
+
+
+@pytest.fixture
+def seeded_user(test_session: Session) -> User:
+    """
+    Existing user to be updated
+
+    Inserts the canonical John Doe user with a Core INSERT, so the row is
+    not held in the identity map of test_session.
+
+    Args:
+        test_session: Test database session fixture
+
+    Returns:
+        User: Inserted user (detached instance holding the stored values)
+    """
+    user = User(**DEFAULT_USER)
+    test_session.execute(insert(User).values(**user.model_dump()))
+    test_session.commit()
+    return user
+
+
+def test_update_user_success(client: TestClient, seeded_user: User):
     """
     Test PUT /user with valid data
 
     Should update an existing user successfully
     """
-    # Create a user first
-    user = User(
-        name="John",
-        lastname="Doe",
-        age=30,
-        country="USA",
-        home_address="123 Main St"
-    )
-    test_session.add(user)
-    test_session.commit()
-    test_session.refresh(user)
+    user = seeded_user
 
     # Update the user
-    user_data = {
-        "id": user.id,
-        "name": "John Updated",
-        "lastname": "Doe Updated",
-        "age": 31,
-        "country": "Canada",
-        "home_address": "456 Oak Ave"
-    }
+    user_data = {**_BASE_UPDATE, "id": user.id}
 
-    response = client.put("/user", json=user_data)
+    response = send_json(client, "PUT", "/user", user_data)
 
-    assert response.status_code == 200
-    data = response.json()
-
-    # Verify response structure
-    assert "code" in data
-    assert "message" in data
-    assert "data" in data
-    assert data["code"] == 200
-    assert data["error"] is None
-
-    # Verify updated user data
-    updated_user = data["data"]
-    assert updated_user["id"] == user.id
-    assert updated_user["name"] == "John Updated"
-    assert updated_user["lastname"] == "Doe Updated"
-    assert updated_user["age"] == 31
-    assert updated_user["country"] == "Canada"
-    assert updated_user["home_address"] == "456 Oak Ave"
-
-    # Verify in database (refresh session to see updates from API)
-    test_session.expire_all()
-    db_user = test_session.get(User, user.id)
-    assert db_user.name == "John Updated"
-    assert db_user.lastname == "Doe Updated"
-    assert db_user.age == 31
-    assert db_user.country == "Canada"
-    assert db_user.home_address == "456 Oak Ave"
+    # Verify response structure and updated user data
+    _assert_ok(response, id=user.id, **_BASE_UPDATE)
 
 
-def test_update_user_partial_update(client: TestClient, test_session: Session):
+def test_update_user_partial_update(client: TestClient, seeded_user: User):
     """
     Test PUT /user with partial data
 
     Should update only provided fields
     """
-    # Create a user first
-    user = User(
-        name="John",
-        lastname="Doe",
-        age=30,
-        country="USA",
-        home_address="123 Main St"
-    )
-    test_session.add(user)
-    test_session.commit()
-    test_session.refresh(user)
+    user = seeded_user
 
     # Update only name
     user_data = {
@@ -93,30 +100,26 @@ def test_update_user_partial_update(client: TestClient, test_session: Session):
         "name": "John Updated"
     }
 
-    response = client.put("/user", json=user_data)
-
-    assert response.status_code == 200
-    data = response.json()
+    response = send_json(client, "PUT", "/user", user_data)
 
-    updated_user = data["data"]
-    assert updated_user["name"] == "John Updated"
     # Other fields should remain unchanged
-    assert updated_user["lastname"] == "Doe"
-    assert updated_user["age"] == 30
-    assert updated_user["country"] == "USA"
-    assert updated_user["home_address"] == "123 Main St"
-
-    # Verify in database (refresh session to see updates from API)
-    test_session.expire_all()
+    _assert_ok(
+        response,
+        name="John Updated",
+        lastname="Doe",
+        age=30,
+        country="USA",
+        home_address="123 Main St"
+    )
 
 
-def test_update_user_not_found(client: TestClient):
+def test_update_user_not_found(bare_client: TestClient):
     """
     Test PUT /user with non-existent user ID
 
     Should return 404 Not Found error
     """
-    non_existent_id = str(uuid.uuid4())
+    non_existent_id = _MISSING_ID
     user_data = {
         "id": non_existent_id,
         "name": "Test",
@@ -126,15 +129,15 @@ def test_update_user_not_found(client: TestClient):
         "home_address": "123 St"
     }
 
-    response = client.put("/user", json=user_data)
+    response = send_json(bare_client, "PUT", "/user", user_data)
 
     assert response.status_code == 404
-    data = response.json()
+    data = rjson(response)
     assert data["code"] == 404
     assert "見つかりません" in data.get("message", "") or "見つかりません" in data.get("detail", "")
 
 
-def test_update_user_without_id(client: TestClient):
+def test_update_user_without_id(bare_client: TestClient):
     """
     Test PUT /user without ID
 
@@ -146,68 +149,76 @@ def test_update_user_without_id(client: TestClient):
         "age": 30
     }
 
-    response = client.put("/user", json=user_data)
+    response = send_json(bare_client, "PUT", "/user", user_data)
 
     # Should fail because ID is required for update
     assert response.status_code in [404, 422]
 
 
-def test_update_user_with_empty_strings(client: TestClient, test_session: Session):
-    """
-    Test PUT /user with empty string values
-
-    Should update fields to empty strings
-    """
-    # Create a user first
-    user = User(
-        name="John",
-        lastname="Doe",
-        age=30,
-        country="USA",
-        home_address="123 Main St"
-    )
-    test_session.add(user)
-    test_session.commit()
-    test_session.refresh(user)
-
-    # Update with empty strings
-    user_data = {
-        "id": user.id,
-        "name": "",
-        "lastname": "",
-        "country": "",
-        "home_address": ""
-    }
-
-    response = client.put("/user", json=user_data)
-
-    assert response.status_code == 200
-    data = response.json()
-
-    updated_user = data["data"]
-    assert updated_user["name"] == ""
-    assert updated_user["lastname"] == ""
-    assert updated_user["country"] == ""
-    assert updated_user["home_address"] == ""
+UPDATE_USER_CASES = [
+    pytest.param(
+        {"name": "", "lastname": "", "country": "", "home_address": ""}, (200,),
+        id="empty_strings"
+    ),
+    pytest.param(
+        {"name": "José", "lastname": "García", "country": "México", "home_address": "Calle 123"},
+        (200,),
+        id="unicode_characters"
+    ),
+    pytest.param(
+        {"name": "山田", "lastname": "太郎", "country": "日本", "home_address": "東京都渋谷区"}, (200,),
+        id="japanese_characters"
+    ),
+    pytest.param(
+        {"name": "O'Brien", "lastname": "Smith-Johnson", "home_address": "123 Main St. #4, Apt. B"},
+        (200,),
+        id="special_characters"
+    ),
+    pytest.param({"name": "A" * 500, "home_address": "B" * 1000}, (200,), id="long_strings"),
+    pytest.param({"age": 0}, (200,), id="age_to_zero"),
+    # Negative age is either accepted or rejected depending on validation
+    pytest.param({"age": -1}, (200, 422), id="age_to_negative"),
+    pytest.param({"age": 999999}, (200,), id="age_to_very_large"),
+]
+
+
+@pytest.mark.parametrize("payload_overrides,expected_statuses", UPDATE_USER_CASES)
+def test_update_user_field_values(
+    client: TestClient,
+    seeded_user: User,
+    test_session: Session,
+    payload_overrides: dict,
+    expected_statuses: tuple
+):
+    """
+    Test PUT /user with edge-case field values
+
+    Should store and echo back empty strings, Unicode, Japanese and special
+    characters, long strings and boundary ages
+    """
+    user = seeded_user
+
+    response = send_json(client, "PUT", "/user", {"id": user.id, **payload_overrides})
+
+    assert response.status_code in expected_statuses
+    if response.status_code != 200:
+        return
+
+    _assert_ok(response, **payload_overrides)
+
+    # Verify in database (seeded_user is not in the identity map, so this reads the row)
+    db_user = test_session.get(User, user.id)
+    for field, value in payload_overrides.items():
+        assert getattr(db_user, field) == value
 
 
-def test_update_user_with_none_values(client: TestClient, test_session: Session):
+def test_update_user_with_none_values(client: TestClient, seeded_user: User):
     """
     Test PUT /user with None values
 
     Should update fields to None
     """
-    # Create a user first
-    user = User(
-        name="John",
-        lastname="Doe",
-        age=30,
-        country="USA",
-        home_address="123 Main St"
-    )
-    test_session.add(user)
-    test_session.commit()
-    test_session.refresh(user)
+    user = seeded_user
 
     # Update with None values
     user_data = {
@@ -219,291 +230,25 @@ def test_update_user_with_none_values(client: TestClient, test_session: Session)
         "home_address": None
     }
 
-    response = client.put("/user", json=user_data)
-
-    assert response.status_code == 200
-    data = response.json()
-
-    updated_user = data["data"]
-    assert updated_user.get("name") is None
-    assert updated_user.get("lastname") is None
-    assert updated_user.get("age") is None
-    assert updated_user.get("country") is None
-    assert updated_user.get("home_address") is None
-
-
-def test_update_user_with_unicode_characters(client: TestClient, test_session: Session):
-    """
-    Test PUT /user with Unicode characters
-
-    Should handle Unicode characters correctly
-    """
-    # Create a user first
-    user = User(
-        name="John",
-        lastname="Doe",
-        age=30,
-        country="USA",
-        home_address="123 Main St"
-    )
-    test_session.add(user)
-    test_session.commit()
-    test_session.refresh(user)
-
-    # Update with Unicode characters
-    user_data = {
-        "id": user.id,
-        "name": "José",
-        "lastname": "García",
-        "country": "México",
-        "home_address": "Calle 123"
-    }
-
-    response = client.put("/user", json=user_data)
-
-    assert response.status_code == 200
-    data = response.json()
-
-    updated_user = data["data"]
-    assert updated_user["name"] == "José"
-    assert updated_user["lastname"] == "García"
-    assert updated_user["country"] == "México"
-    assert updated_user["home_address"] == "Calle 123"
-
-    # Verify in database (refresh session to see updates from API)
-    test_session.expire_all()
-    db_user = test_session.get(User, user.id)
-    assert db_user.name == "José"
-    assert db_user.lastname == "García"
+    response = send_json(client, "PUT", "/user", user_data)
 
-
-def test_update_user_with_japanese_characters(client: TestClient, test_session: Session):
-    """
-    Test PUT /user with Japanese characters
-
-    Should handle Japanese characters correctly
-    """
-    # Create a user first
-    user = User(
-        name="John",
-        lastname="Doe",
-        age=30,
-        country="USA",
-        home_address="123 Main St"
+    _assert_ok(
+        response,
+        name=None,
+        lastname=None,
+        age=None,
+        country=None,
+        home_address=None
     )
-    test_session.add(user)
-    test_session.commit()
-    test_session.refresh(user)
 
-    # Update with Japanese characters
-    user_data = {
-        "id": user.id,
-        "name": "山田",
-        "lastname": "太郎",
-        "country": "日本",
-        "home_address": "東京都渋谷区"
-    }
-
-    response = client.put("/user", json=user_data)
-
-    assert response.status_code == 200
-    data = response.json()
-
-    updated_user = data["data"]
-    assert updated_user["name"] == "山田"
-    assert updated_user["lastname"] == "太郎"
-    assert updated_user["country"] == "日本"
-    assert updated_user["home_address"] == "東京都渋谷区"
-
-
-def test_update_user_with_special_characters(client: TestClient, test_session: Session):
-    """
-    Test PUT /user with special characters
 
-    Should handle special characters correctly
-    """
-    # Create a user first
-    user = User(
-        name="John",
-        lastname="Doe",
-        age=30,
-        country="USA",
-        home_address="123 Main St"
-    )
-    test_session.add(user)
-    test_session.commit()
-    test_session.refresh(user)
-
-    # Update with special characters
-    user_data = {
-        "id": user.id,
-        "name": "O'Brien",
-        "lastname": "Smith-Johnson",
-        "home_address": "123 Main St. #4, Apt. B"
-    }
-
-    response = client.put("/user", json=user_data)
-
-    assert response.status_code == 200
-    data = response.json()
-
-    updated_user = data["data"]
-    assert updated_user["name"] == "O'Brien"
-    assert updated_user["lastname"] == "Smith-Johnson"
-    assert updated_user["home_address"] == "123 Main St. #4, Apt. B"
-
-
-def test_update_user_with_long_strings(client: TestClient, test_session: Session):
-    """
-    Test PUT /user with very long string values
-
-    Should handle long strings correctly
-    """
-    # Create a user first
-    user = User(
-        name="John",
-        lastname="Doe",
-        age=30,
-        country="USA",
-        home_address="123 Main St"
-    )
-    test_session.add(user)
-    test_session.commit()
-    test_session.refresh(user)
-
-    # Update with long strings
-    long_name = "A" * 500
-    long_address = "B" * 1000
-
-    user_data = {
-        "id": user.id,
-        "name": long_name,
-        "home_address": long_address
-    }
-
-    response = client.put("/user", json=user_data)
-
-    assert response.status_code == 200
-    data = response.json()
-
-    updated_user = data["data"]
-    assert len(updated_user["name"]) == 500
-    assert len(updated_user["home_address"]) == 1000
-
-
-def test_update_user_age_to_zero(client: TestClient, test_session: Session):
-    """
-    Test PUT /user with age = 0
-
-    Should accept zero as a valid age
-    """
-    # Create a user first
-    user = User(
-        name="John",
-        lastname="Doe",
-        age=30,
-        country="USA",
-        home_address="123 Main St"
-    )
-    test_session.add(user)
-    test_session.commit()
-    test_session.refresh(user)
-
-    # Update age to 0
-    user_data = {
-        "id": user.id,
-        "age": 0
-    }
-
-    response = client.put("/user", json=user_data)
-
-    assert response.status_code == 200
-    data = response.json()
-
-    updated_user = data["data"]
-    assert updated_user["age"] == 0
-
-
-def test_update_user_age_to_negative(client: TestClient, test_session: Session):
-    """
-    Test PUT /user with negative age
-
-    Should either accept or reject based on validation
-    """
-    # Create a user first
-    user = User(
-        name="John",
-        lastname="Doe",
-        age=30,
-        country="USA",
-        home_address="123 Main St"
-    )
-    test_session.add(user)
-    test_session.commit()
-    test_session.refresh(user)
-
-    # Update age to negative
-    user_data = {
-        "id": user.id,
-        "age": -1
-    }
-
-    response = client.put("/user", json=user_data)
-
-    # Should either accept or reject
-    assert response.status_code in [200, 422]
-
-
-def test_update_user_age_to_very_large(client: TestClient, test_session: Session):
-    """
-    Test PUT /user with very large age
-
-    Should handle large integer values
-    """
-    # Create a user first
-    user = User(
-        name="John",
-        lastname="Doe",
-        age=30,
-        country="USA",
-        home_address="123 Main St"
-    )
-    test_session.add(user)
-    test_session.commit()
-    test_session.refresh(user)
-
-    # Update age to very large number
-    user_data = {
-        "id": user.id,
-        "age": 999999
-    }
-
-    response = client.put("/user", json=user_data)
-
-    assert response.status_code == 200
-    data = response.json()
-
-    updated_user = data["data"]
-    assert updated_user["age"] == 999999
-
-
-def test_update_user_wrong_data_types(client: TestClient, test_session: Session):
+def test_update_user_wrong_data_types(client: TestClient, seeded_user: User):
     """
     Test PUT /user with wrong data types
 
     Should return 422 validation error
     """
-    # Create a user first
-    user = User(
-        name="John",
-        lastname="Doe",
-        age=30,
-        country="USA",
-        home_address="123 Main St"
-    )
-    test_session.add(user)
-    test_session.commit()
-    test_session.refresh(user)
+    user = seeded_user
 
     # Try to update with wrong types
     user_data = {
@@ -512,106 +257,73 @@ def test_update_user_wrong_data_types(client: TestClient, test_session: Session)
         "age": "thirty"  # Should be integer
     }
 
-    response = client.put("/user", json=user_data)
+    response = send_json(client, "PUT", "/user", user_data)
 
     assert response.status_code == 422
-    data = response.json()
+    data = rjson(response)
     assert "error" in data or "detail" in data
 
 
-def test_update_user_invalid_json(client: TestClient):
+def test_update_user_invalid_json(bare_client: TestClient):
     """
     Test PUT /user with invalid JSON
 
     Should return 422 validation error
     """
-    response = client.put(
+    response = bare_client.put(
         "/user",
-        data="invalid json",
+        content="invalid json",
         headers={"Content-Type": "application/json"}
     )
 
     assert response.status_code == 422
 
 
-def test_update_user_database_consistency(client: TestClient, test_session: Session):
+def test_update_user_database_consistency(
+    client: TestClient,
+    seeded_user: User,
+    test_session: Session
+):
     """
     Test PUT /user database consistency
 
     Should maintain data integrity after update
     """
-    # Create a user first
-    user = User(
-        name="John",
-        lastname="Doe",
-        age=30,
-        country="USA",
-        home_address="123 Main St"
-    )
-    test_session.add(user)
-    test_session.commit()
-    test_session.refresh(user)
+    user = seeded_user
 
     # Update the user
-    user_data = {
-        "id": user.id,
-        "name": "John Updated",
-        "lastname": "Doe Updated",
-        "age": 31,
-        "country": "Canada",
-        "home_address": "456 Oak Ave"
-    }
+    user_data = {**_BASE_UPDATE, "id": user.id}
 
-    response = client.put("/user", json=user_data)
+    response = send_json(client, "PUT", "/user", user_data)
     assert response.status_code == 200
 
-    # Verify in database (refresh session to see updates from API)
-    test_session.expire_all()
+    # Verify in database (seeded_user is not in the identity map, so this reads the row)
     db_user = test_session.get(User, user.id)
-    assert db_user.name == "John Updated"
-    assert db_user.lastname == "Doe Updated"
-    assert db_user.age == 31
-    assert db_user.country == "Canada"
-    assert db_user.home_address == "456 Oak Ave"
-
-    # Verify user can be retrieved via GET
-    list_response = client.get("/user/list")
-    assert list_response.status_code == 200
-    users = list_response.json()["data"]["items"]
-    user_ids = [u["id"] for u in users]
-    assert user.id in user_ids
-
-    # Verify updated data in list
-    updated_user_in_list = next(u for u in users if u["id"] == user.id)
-    assert updated_user_in_list["name"] == "John Updated"
-    assert updated_user_in_list["age"] == 31
-
-
-def test_update_user_multiple_updates_consistency(client: TestClient, test_session: Session):
+    for field, value in _BASE_UPDATE.items():
+        assert getattr(db_user, field) == value
+
+
+async def test_update_user_multiple_updates_consistency(
+    async_client: AsyncClient,
+    seeded_user: User,
+    test_session: Session
+):
     """
     Test PUT /user with multiple sequential updates
 
     Should maintain consistency across multiple operations
     """
-    # Create a user first
-    user = User(
-        name="John",
-        lastname="Doe",
-        age=30,
-        country="USA",
-        home_address="123 Main St"
-    )
-    test_session.add(user)
-    test_session.commit()
-    test_session.refresh(user)
+    user = seeded_user
 
+    # Updates are awaited one at a time: the final-state assertions depend on
+    # their order, and all requests share the test connection
     # First update
     user_data1 = {
         "id": user.id,
         "name": "John First",
         "age": 31
     }
-    response1 = client.put("/user", json=user_data1)
+    response1 = await send_json(async_client, "PUT", "/user", user_data1)
     assert response1.status_code == 200
 
     # Second update
@@ -620,7 +332,7 @@ def test_update_user_multiple_updates_consistency(client: TestClient, test_sessi
         "name": "John Second",
         "age": 32
     }
-    response2 = client.put("/user", json=user_data2)
+    response2 = await send_json(async_client, "PUT", "/user", user_data2)
     assert response2.status_code == 200
 
     # Third update
@@ -629,44 +341,25 @@ def test_update_user_multiple_updates_consistency(client: TestClient, test_sessi
         "name": "John Third",
         "age": 33
     }
-    response3 = client.put("/user", json=user_data3)
+    response3 = await send_json(async_client, "PUT", "/user", user_data3)
     assert response3.status_code == 200
 
-    # Verify final state in database (refresh session to see updates from API)
-    test_session.expire_all()
+    # Verify final state by primary key (seeded_user is not in the identity map)
     db_user = test_session.get(User, user.id)
     assert db_user.name == "John Third"
     assert db_user.age == 33
 
-    # Verify via GET
-    list_response = client.get("/user/list")
-    assert list_response.status_code == 200
-    users = list_response.json()["data"]["items"]
-    updated_user = next(u for u in users if u["id"] == user.id)
-    assert updated_user["name"] == "John Third"
-    assert updated_user["age"] == 33
 
-
-def test_update_user_id_immutability(client: TestClient, test_session: Session):
+def test_update_user_id_immutability(client: TestClient, seeded_user: User, test_session: Session):
     """
     Test PUT /user ID immutability
 
     Should not allow changing the ID
     """
-    # Create a user first
-    user = User(
-        name="John",
-        lastname="Doe",
-        age=30,
-        country="USA",
-        home_address="123 Main St"
-    )
-    test_session.add(user)
-    test_session.commit()
-    test_session.refresh(user)
+    user = seeded_user
 
     original_id = user.id
-    new_id = str(uuid.uuid4())
+    new_id = _MISSING_ID
 
     # Try to update with different ID
     user_data = {
@@ -674,11 +367,10 @@ def test_update_user_id_immutability(client: TestClient, test_session: Session):
         "name": "Updated"
     }
 
-    response = client.put("/user", json=user_data)
+    response = send_json(client, "PUT", "/user", user_data)
     assert response.status_code == 200
 
-    # Verify ID remains the same (refresh session to see updates from API)
-    test_session.expire_all()
+    # Verify ID remains the same (the row is read fresh; seeded_user is not in the identity map)
     db_user = test_session.get(User, original_id)
     assert db_user is not None
     assert db_user.id == original_id
@@ -0,0 +1,50 @@
+"""
+Shared test helpers
+
+Helper functions used by several test modules.
+"""
+import orjson
+from fastapi.testclient import TestClient
+from httpx import AsyncClient
+
+
+# Canonical user fields shared by the user tests
+DEFAULT_USER = {
+    "name": "John",
+    "lastname": "Doe",
+    "age": 30,
+    "country": "USA",
+    "home_address": "123 Main St"
+}
+
+# Headers for request bodies pre-encoded by send_json()
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def rjson(response) -> dict:
+    """
+    Decode a JSON response body with orjson
+
+    Args:
+        response: HTTP response from the test client
+
+    Returns:
+        dict: Decoded response body
+    """
+    return orjson.loads(response.content)
+
+
+def send_json(client: TestClient | AsyncClient, method: str, url: str, payload):
+    """
+    Send a request with a JSON body pre-encoded by orjson
+
+    Args:
+        client: FastAPI test client or async HTTP client
+        method: HTTP method
+        url: Request URL
+        payload: Data to send as the JSON body
+
+    Returns:
+        Response: HTTP response (awaitable when an AsyncClient is given)
+    """
+    return client.request(method, url, content=orjson.dumps(payload), headers=_JSON_HEADERS)